@@ -5,15 +5,17 @@ import argparse
 import asyncio
 import contextlib
 import csv
+import gc
 import json
 import os
 import re
-from typing import Dict, List, Optional
+import sys
+from typing import Callable, Dict, List, Optional
 from urllib.parse import urlparse
 
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
-PROFILE_BASE = "https://www.tiktok.com"
+from utils import PROFILE_BASE, ensure_output_dir
 
 
 
@@ -102,7 +104,9 @@ async def click_cookies_or_consent(page) -> None:
 
 
 '''
-Maintenant, in va récupèrer et analyser le JSON SIGI_STATE embarqué dans la page TikTok, qui contient les informations des vidéos.
+Maintenant, on va récupèrer le JSON SIGI_STATE embarqué dans la page TikTok, qui contient les informations des vidéos.
+Le JSON est parsé directement dans la page et seuls les champs utiles de la vidéo ciblée (desc, stats, covers) reviennent
+côté Python: sur les grosses pages, le blob complet pèse plusieurs Mo et ne traverse plus l’IPC.
 Si un video_id_hint est fourni et correspond à une vidéo, elle renvoie les données de cette vidéo.
 Sinon, elle renvoie la première vidéo disponible, ou un dictionnaire vide si aucune donnée n’est trouvée.
 '''
@@ -110,15 +114,23 @@ async def parse_sigi_state(page, video_id_hint: str = "") -> Dict:
     try:
         script = page.locator('script#SIGI_STATE')
         await script.wait_for(state="attached", timeout=10000)
-        raw = await script.inner_text()
-        data = json.loads(raw)
-        item_module = data.get("ItemModule", {})
-        if not item_module:
-            return {}
-        if video_id_hint and video_id_hint in item_module:
-            return item_module[video_id_hint]
-        for _, item in item_module.items():
-            return item
+        item = await script.evaluate("""
+        (el, hint) => {
+          const data = JSON.parse(el.textContent || '{}');
+          const mod = data.ItemModule || {};
+          let it = (hint && mod[hint]) ? mod[hint] : null;
+          if (!it) {
+            for (const k in mod) { it = mod[k]; break; }
+          }
+          if (!it) return {};
+          const video = {};
+          for (const k of ['cover', 'originCover', 'dynamicCover', 'downloadAddr', 'poster']) {
+            if (it.video && typeof it.video[k] === 'string') video[k] = it.video[k];
+          }
+          return { desc: it.desc || '', stats: it.stats || {}, video };
+        }
+        """, video_id_hint)
+        return item or {}
     except Exception:
         pass
     return {}
@@ -188,17 +200,20 @@ async def _first_attr(page, selectors, attr: str, timeout=2000) -> Optional[str]
 
 '''
 Elle permet de récupérer le nombre de vues directement depuis le texte de la page quand les autres méthodes échouent.
-C'est le dernier recours pour obtenir les vues
+C'est le dernier recours pour obtenir les vues.
+La recherche se fait dans la page: seul le fragment trouvé revient, pas tout le innerText.
 '''
 async def _views_from_page_text(page) -> Optional[int]:
     try:
-        txt = await page.evaluate("() => document.body.innerText")
-        if not txt:
-            return None
-        
-        m = re.search(r"([0-9][0-9,.\s]*[KMB]?)\s+(views|vues)\b", txt, flags=re.I)
-        if m:
-            return _parse_abbrev_num(m.group(1))
+        snippet = await page.evaluate("""
+        () => {
+          const txt = document.body ? document.body.innerText : '';
+          const m = txt.match(/([0-9][0-9,.\\s]*[KMB]?)\\s+(views|vues)\\b/i);
+          return m ? m[1] : '';
+        }
+        """)
+        if snippet:
+            return _parse_abbrev_num(snippet)
     except Exception:
         pass
     return None
@@ -255,26 +270,48 @@ async def fetch_jsonld_thumbnail(page) -> str:
     return ""
 
 
+'''
+Enregistrement compact d’une vidéo de la grille: __slots__ évite un dict par objet, ce qui compte quand un profil
+dépasse les 10k vidéos et que tous les éléments restent en mémoire pendant le défilement.
+'''
+class GridItem:
+    __slots__ = ("url", "grid_views", "grid_thumb")
+
+    def __init__(self, url: str, grid_views: int = 0, grid_thumb: str = ""):
+        self.url = url
+        self.grid_views = grid_views
+        self.grid_thumb = grid_thumb
+
+    def __repr__(self) -> str:
+        return f"GridItem(url={self.url!r}, grid_views={self.grid_views}, grid_thumb={self.grid_thumb!r})"
+
+
 '''
 Cette fonction fait défiler la page d’un profil TikTok et récupère les vidéos visibles dans la grille, en enregistrant pour chacune son URL, 
 le nombre de vues affiché et un éventuel thumbnail de la vignette (grid_thumb) en dernier recours.
 '''
-async def gather_profile_items(page, username: str, limit: int = 50, wait_ms: int = 600) -> List[Dict]:
-    items: Dict[str, Dict] = {}
+async def gather_profile_items(page, username: str, limit: int = 50, wait_ms: int = 600) -> List[GridItem]:
+    items: Dict[str, GridItem] = {}
     last_count = -1
     retries_same_count = 0
     username = normalize_username(username)
     target_pattern = f"/@{username}/video/"
 
-    async def scrape_grid_batch() -> Dict[str, Dict]:
+    async def scrape_grid_batch() -> None:
+        # Le filtre sur le profil, l’extraction des vues et le suivi des vignettes déjà lues se font dans la page:
+        # chaque défilement ne renvoie que les nouvelles vidéos, au lieu de toute la grille à chaque fois.
+        # Une vignette n’est marquée comme lue qu’une fois ses vues et un thumbnail http(s) chargés (lazy-loading).
         data = await page.evaluate("""
-        () => {
+        (targetPattern) => {
+          const seen = window.__tiktokScraperSeen || (window.__tiktokScraperSeen = new Set());
           const containers = Array.from(document.querySelectorAll(
             '[data-e2e="user-post-item"], [data-e2e="tiktok-post"], li:has(a[href*="/video/"])'
           ));
-          return containers.map(el => {
+          const out = [];
+          for (const el of containers) {
             const a = el.querySelector('a[href*="/video/"]');
             const href = a ? (a.href || '').split('?')[0] : '';
+            if (!href || !href.includes(targetPattern) || seen.has(href)) continue;
 
             // Plusieurs chemins possibles pour le texte des vues
             const picks = [
@@ -303,6 +340,9 @@ async def gather_profile_items(page, username: str, limit: int = 50, wait_ms: in
             if (!txt && a && a.getAttribute('aria-label')) {
               txt = a.getAttribute('aria-label');
             }
+            // On ne renvoie que le nombre (ex: "12.3K"), pas tout le texte
+            const m = txt ? txt.match(/([0-9][0-9,.\\s]*[KMBkmb]?)/) : null;
+            const views = m ? m[1] : txt.trim();
 
             // Essayer de récupérer un thumbnail depuis la grille
             const imgEl = el.querySelector('img') || (a ? a.querySelector('img') : null);
@@ -314,29 +354,29 @@ async def gather_profile_items(page, username: str, limit: int = 50, wait_ms: in
               }
             }
 
-            return { href, txt, gridThumb };
-          });
+            // Les grilles lazy-loadées affichent d'abord un placeholder (data:, gif 1×1): on attend une vraie URL
+            if (views && gridThumb.startsWith('http')) seen.add(href);
+            out.push({ href, views, gridThumb });
+          }
+          return out;
         }
-        """)
-        out: Dict[str, Dict] = {}
+        """, target_pattern)
         for row in data:
             href = (row.get("href") or "").strip()
-            if not href or target_pattern not in href:
-                continue
             url = href if href.startswith("http") else PROFILE_BASE + href
-            raw = (row.get("txt") or "").strip()
-            m = re.search(r"([0-9][0-9,.\s]*[KMBkmb]?)", raw) if raw else None
-            val = _parse_abbrev_num(m.group(1)) if m else (_parse_abbrev_num(raw) if raw else 0)
+            val = _parse_abbrev_num(row.get("views") or "")
             grid_thumb = (row.get("gridThumb") or "").strip()
-            out[url] = {
-                "grid_views": int(val or 0),
-                "grid_thumb": grid_thumb,
-            }
-        return out
+            it = items.get(url)
+            if it is None:
+                items[url] = GridItem(url, int(val or 0), grid_thumb)
+            else:
+                it.grid_views = int(val or it.grid_views)
+                # un placeholder ne remplace jamais une vraie URL déjà vue
+                if grid_thumb and (grid_thumb.startswith("http") or not it.grid_thumb.startswith("http")):
+                    it.grid_thumb = grid_thumb
 
     while True:
-        batch = await scrape_grid_batch()
-        items.update(batch)
+        await scrape_grid_batch()
         if limit and len(items) >= limit:
             break
         await page.evaluate("window.scrollBy(0, document.body.scrollHeight)")
@@ -349,10 +389,10 @@ async def gather_profile_items(page, username: str, limit: int = 50, wait_ms: in
         if retries_same_count >= 5:
             break
 
-    urls = list(items.keys())
+    out = list(items.values())
     if limit:
-        urls = urls[:limit]
-    return [{"url": u, "grid_views": items[u]["grid_views"], "grid_thumb": items[u]["grid_thumb"]} for u in urls]
+        out = out[:limit]
+    return out
 
 
 '''
@@ -482,6 +522,167 @@ async def scrape_video_details(page, url: str, grid_views_hint: int = 0, grid_th
     }
 
 
+'''
+Petits utilitaires mémoire: lire la limite et la consommation du conteneur (cgroup v2 puis v1).
+La consommation est le "working set" utilisé par docker et kubelet: usage moins le cache fichier inactif (inactive_file),
+sinon de simples lectures/écritures de fichiers feraient croire à un risque d’OOM.
+Sans cgroup, on additionne la mémoire du process Python et de tous ses descendants (driver Playwright et processus Chromium),
+car c’est Chromium qui consomme l’essentiel de la mémoire. On lit le PSS (/proc/<pid>/smaps_rollup), qui répartit les pages
+partagées entre les processus Chromium: additionner leurs RSS compterait ces pages plusieurs fois (jusqu’à ~2x).
+Le RSS (statm) n’est utilisé que si smaps_rollup n’existe pas (noyaux < 4.14).
+'''
+def _read_int_file(path: str) -> Optional[int]:
+    try:
+        with open(path, "r", encoding="ascii") as f:
+            raw = f.read().strip()
+        return int(raw) if raw.isdigit() else None
+    except Exception:
+        return None
+
+
+def _read_stat_value(path: str, keys) -> Optional[int]:
+    # keys par ordre de priorité (cgroup v1: total_inactive_file, hiérarchique comme usage_in_bytes, avant inactive_file)
+    values: Dict[str, int] = {}
+    try:
+        with open(path, "r", encoding="ascii") as f:
+            for line in f:
+                parts = line.split()
+                # memory.stat: "inactive_file 1234"; smaps_rollup: "Pss:   488 kB"
+                if len(parts) >= 2 and parts[0] in keys:
+                    values[parts[0]] = int(parts[1])
+    except Exception:
+        return None
+    for key in keys:
+        if key in values:
+            return values[key]
+    return None
+
+
+def container_memory_limit() -> Optional[int]:
+    for path in ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory/memory.limit_in_bytes"):
+        val = _read_int_file(path)
+        # cgroup v1 renvoie une valeur énorme (~2^63) quand il n’y a pas de limite
+        if val and val < (1 << 60):
+            return val
+    return None
+
+
+def _process_pss(pid: int) -> Optional[int]:
+    pss = _read_stat_value(f"/proc/{pid}/smaps_rollup", ("Pss:",))
+    if pss is not None:
+        return pss * 1024
+    try:
+        with open(f"/proc/{pid}/statm", "r", encoding="ascii") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        return None
+
+
+def _process_tree_memory(root_pid: int) -> Optional[int]:
+    try:
+        children: Dict[int, List[int]] = {}
+        for name in os.listdir("/proc"):
+            if not name.isdigit():
+                continue
+            try:
+                with open(f"/proc/{name}/stat", "r", encoding="ascii", errors="replace") as f:
+                    # le nom du process (entre parenthèses) peut contenir des espaces: on découpe après la dernière ")"
+                    ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+                children.setdefault(ppid, []).append(int(name))
+            except Exception:
+                continue
+        total = 0
+        stack = [root_pid]
+        while stack:
+            pid = stack.pop()
+            stack.extend(children.get(pid, []))
+            mem = _process_pss(pid)
+            if mem is not None:
+                total += mem
+        return total or None
+    except Exception:
+        return None
+
+
+def current_memory_usage() -> Optional[int]:
+    for usage_path, stat_path, keys in (
+        ("/sys/fs/cgroup/memory.current", "/sys/fs/cgroup/memory.stat", ("inactive_file",)),
+        ("/sys/fs/cgroup/memory/memory.usage_in_bytes", "/sys/fs/cgroup/memory/memory.stat", ("total_inactive_file", "inactive_file")),
+    ):
+        usage = _read_int_file(usage_path)
+        if usage:
+            inactive = _read_stat_value(stat_path, keys) or 0
+            return max(0, usage - inactive)
+    return _process_tree_memory(os.getpid())
+
+
+'''
+Garde-fou mémoire: remplace le Semaphore fixe du scraping parallèle.
+Avant chaque nouvelle page, on compare la consommation du conteneur à la limite:
+au-delà de high_ratio on retire une page parallèle (jamais moins d’une), en dessous de low_ratio on en rend une.
+Sans limite connue, il se comporte exactement comme asyncio.Semaphore(max_concurrency).
+'''
+class MemoryGuard:
+    def __init__(
+        self,
+        max_concurrency: int,
+        limit_bytes: Optional[int] = None,
+        high_ratio: float = 0.85,
+        low_ratio: float = 0.65,
+        poll_s: float = 0.5,
+    ):
+        self.max_concurrency = max(1, int(max_concurrency))
+        self.concurrency = self.max_concurrency
+        self.limit_bytes = limit_bytes
+        self.high_ratio = high_ratio
+        self.low_ratio = low_ratio
+        self.poll_s = poll_s
+        self._active = 0
+        self._last_adjust = 0.0
+        self._cond = asyncio.Condition()
+
+    def _adjust(self) -> None:
+        if not self.limit_bytes:
+            return
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        if now - self._last_adjust < self.poll_s:
+            return
+        self._last_adjust = now
+        usage = current_memory_usage()
+        if usage is None:
+            return
+        ratio = usage / self.limit_bytes
+        if ratio >= self.high_ratio and self.concurrency > 1:
+            self.concurrency -= 1
+            gc.collect()
+            print(f"Mémoire à {ratio:.0%} de la limite: pages parallèles réduites à {self.concurrency}.")
+        elif ratio < self.low_ratio and self.concurrency < self.max_concurrency:
+            self.concurrency += 1
+
+    async def acquire(self) -> None:
+        async with self._cond:
+            while True:
+                self._adjust()
+                if self._active < self.concurrency:
+                    self._active += 1
+                    return
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._cond.wait(), timeout=self.poll_s)
+
+    async def release(self) -> None:
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify()
+
+    async def __aenter__(self) -> "MemoryGuard":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.release()
+
+
 '''
 Cette fonction orchestrate tout le scraping d’un profil TikTok de A à Z :
 
@@ -492,19 +693,26 @@ Cette fonction orchestrate tout le scraping d’un profil TikTok de A à Z :
 3-Ouverture de la page profil et collecte des vidéos visibles dans la grille.
 
 4-Scraping parallèle des vidéos (2 à 4 pages à la fois) pour récupérer :
+(si memory_limit_bytes est fourni, le nombre de pages parallèles baisse automatiquement quand la mémoire
+s’en approche; None désactive le garde-fou)
 
 URL, description, thumbnail, vues, likes, commentaires.
+Un nombre fixe de workers (parallel_pages) se partage la liste des vidéos: pas de tâche en attente par vidéo.
 
 5-Fermeture propre du navigateur et du contexte.
 
 6-Retourne une liste de dictionnaires, une par vidéo, avec toutes les infos.
+Si on_row est fourni, chaque ligne lui est passée dès qu’elle est prête (dans l’ordre d’arrivée) au lieu d’être
+gardée en mémoire jusqu’à la fin: la liste renvoyée est alors vide.
 '''
 async def scrape_tiktok_profile_async(
     username: str,
     limit: int = 20,
     headless: bool = True,
     timeout_ms: int = 30000,
-    parallel_pages: int = 3
+    parallel_pages: int = 3,
+    memory_limit_bytes: Optional[int] = None,
+    on_row: Optional[Callable[[Dict], None]] = None
 ) -> List[Dict]:
     username = normalize_username(username)
     profile_url = build_profile_url(username)
@@ -552,25 +760,42 @@ async def scrape_tiktok_profile_async(
             await browser.close()
             raise RuntimeError("Aucune vidéo trouvée (profil vide/privé/bloqué).")
 
-        sem = asyncio.Semaphore(max(1, int(parallel_pages)))
+        # La grille du profil garde tout le DOM des vidéos défilées: on la libère avant d’ouvrir les pages vidéo
+        with contextlib.suppress(Exception):
+            await page.close()
+
+        guard = MemoryGuard(parallel_pages, limit_bytes=memory_limit_bytes)
 
-        async def scrape_one(it):
-            async with sem:
+        async def scrape_one(it: GridItem):
+            async with guard:
                 p = await context.new_page()
                 try:
                     return await scrape_video_details(
                         p,
-                        it["url"],
-                        grid_views_hint=it.get("grid_views", 0),
-                        grid_thumb_hint=it.get("grid_thumb", ""),
+                        it.url,
+                        grid_views_hint=it.grid_views,
+                        grid_thumb_hint=it.grid_thumb,
                         timeout_ms=timeout_ms
                     )
                 finally:
                     with contextlib.suppress(Exception):
                         await p.close()
 
-        tasks = [scrape_one(it) for it in items]
-        results = await asyncio.gather(*tasks)
+        results: List[Optional[Dict]] = [None] * len(items) if on_row is None else []
+        pending = iter(enumerate(items))
+
+        async def worker():
+            # l’itérateur partagé sert de file: chaque worker prend la vidéo suivante quand il a fini la sienne
+            for i, it in pending:
+                row = await scrape_one(it)
+                if not row:
+                    continue
+                if on_row is not None:
+                    on_row(row)
+                else:
+                    results[i] = row
+
+        await asyncio.gather(*(worker() for _ in range(guard.max_concurrency)))
         rows = [r for r in results if r]
 
         await context.close()
@@ -579,16 +804,6 @@ async def scrape_tiktok_profile_async(
     return rows
 
 
-'''
-Cette fonction vérifie que le dossier où tu veux enregistrer un fichier existe.
-Si le dossier n’existe pas, elle le crée automatiquement.
-'''
-def ensure_output_dir(path: str) -> None:
-    directory = os.path.dirname(os.path.abspath(path))
-    if directory and not os.path.exists(directory):
-        os.makedirs(directory, exist_ok=True)
-
-
 '''
 Maintenant, on va voir un échantillon rapide et lisible des résultats directement dans la console.
 '''
@@ -603,12 +818,58 @@ def print_sample(rows: List[Dict], n: int = 10) -> None:
         )
 
 
+'''
+Écriture du CSV au fil du scraping, pour ne pas garder toutes les lignes (descriptions comprises) jusqu’à la fin.
+Le fichier n’est ouvert qu’à la première ligne: si le scraping échoue avant, un CSV existant n’est pas écrasé.
+Seules les keep premières lignes sont conservées, pour l’aperçu console.
+'''
+class CsvRowWriter:
+    FIELDS = ["url", "description", "thumbnail", "views", "likes", "comments"]
+
+    def __init__(self, path: str, keep: int = 10):
+        self.path = path
+        self.keep = keep
+        self.count = 0
+        self.sample: List[Dict] = []
+        self._file = None
+        self._writer = None
+
+    def _open(self) -> None:
+        self._file = open(self.path, "w", encoding="utf-8", newline="")
+        self._writer = csv.DictWriter(self._file, fieldnames=self.FIELDS)
+        self._writer.writeheader()
+
+    def write(self, row: Dict) -> None:
+        if self._writer is None:
+            self._open()
+        self._writer.writerow(row)
+        self.count += 1
+        if len(self.sample) < self.keep:
+            self.sample.append(row)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self) -> "CsvRowWriter":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        # Scraping terminé sans aucune ligne: on écrit quand même l’en-tête, comme avant
+        if exc_type is None and self._writer is None:
+            self._open()
+        self.close()
+
+
 '''
 Cette fonction sert à exécuter le scraper depuis la console, gérer les options, lancer le scraping, enregistrer les données et 
 afficher un aperçu.
 '''
 async def run_cli_async():
-    parser = argparse.ArgumentParser(description="Scraper les vidéos d’un profil TikTok public et exporter en CSV.")
+    parser = argparse.ArgumentParser(
+        description="Scraper les vidéos d’un profil TikTok public et exporter en CSV.",
+        epilog="Analyse des CSV produits: scraper.py summarize <fichiers ou dossiers> [options] (voir scraper.py summarize --help).",
+    )
     group = parser.add_mutually_exclusive_group(required=True)
     group.add_argument("--username", type=str, help="Nom d’utilisateur TikTok (avec ou sans @), ex: hugodecrypte")
     group.add_argument("--profile-url", type=str, help="URL complète du profil, ex: https://www.tiktok.com/@hugodecrypte")
@@ -628,6 +889,8 @@ async def run_cli_async():
     parser.add_argument("--parallel-pages", type=int, default=3, help="Nombre de pages parallèles (2–4 recommandé)")
     parser.add_argument("--timeout-ms", type=int, default=30000, help="Timeout de navigation par page (ms)")
     parser.add_argument("--print-rows", type=int, default=10, help="Afficher les N premières lignes (défaut: 10)")
+    parser.add_argument("--memory-limit-mb", type=int, default=0, help="Limite mémoire (Mo) avant de réduire les pages parallèles (défaut: limite du conteneur si détectée)")
+    parser.add_argument("--no-memory-guard", action="store_true", help="Désactiver le garde-fou mémoire (pages parallèles fixes)")
 
     args = parser.parse_args()
 
@@ -649,29 +912,41 @@ async def run_cli_async():
     proxy_env = os.environ.get("HTTPS_PROXY") or os.environ.get("HTTP_PROXY")
     if proxy_env:
         print("Proxy détecté via HTTPS_PROXY/HTTP_PROXY.")
+    memory_limit = None
+    if not args.no_memory_guard:
+        memory_limit = args.memory_limit_mb * 1024 * 1024 if args.memory_limit_mb > 0 else container_memory_limit()
+        if memory_limit and current_memory_usage() is None:
+            print("Garde-fou mémoire désactivé: consommation mémoire illisible sur ce système.")
+            memory_limit = None
+        if memory_limit:
+            print(f"Garde-fou mémoire: {memory_limit // (1024 * 1024)} Mo")
+
+    with CsvRowWriter(output_path, keep=args.print_rows) as out:
+        await scrape_tiktok_profile_async(
+            username=username,
+            limit=args.limit,
+            headless=headless,
+            timeout_ms=args.timeout_ms,
+            parallel_pages=args.parallel_pages,
+            memory_limit_bytes=memory_limit,
+            on_row=out.write,
+        )
 
-    rows = await scrape_tiktok_profile_async(
-        username=username,
-        limit=args.limit,
-        headless=headless,
-        timeout_ms=args.timeout_ms,
-        parallel_pages=args.parallel_pages,
-    )
-
-    
-    with open(output_path, "w", encoding="utf-8", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=["url", "description", "thumbnail", "views", "likes", "comments"])
-        writer.writeheader()
-        for r in rows:
-            writer.writerow(r)
-
-    print(f"\nCSV écrit: {output_path} ({len(rows)} lignes)")
-    if rows:
-        print_sample(rows, n=args.print_rows)
+    print(f"\nCSV écrit: {output_path} ({out.count} lignes)")
+    if out.sample:
+        print_sample(out.sample, n=args.print_rows)
 
 
 
+'''
+Point d’entrée: "summarize" lance l’analyse des CSV déjà produits (voir summary.py), sinon on scrape.
+NumPy n’est importé que dans ce cas, le scraping n’en dépend pas.
+'''
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "summarize":
+        from summary import run_summarize_cli
+        run_summarize_cli(sys.argv[2:])
+        return
     asyncio.run(run_cli_async())
 
 
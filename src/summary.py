@@ -0,0 +1,703 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import contextlib
+import csv
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+from array import array
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from utils import PROFILE_BASE, ensure_output_dir
+
+CACHE_VERSION = 3
+CHUNK_BYTES = 32 * 1024 * 1024
+COLUMNS = {
+    "video_id": np.uint64,
+    "profile": np.int32,
+    "views": np.int64,
+    "likes": np.int64,
+    "comments": np.int64,
+}
+BUCKETS = {"day": "D", "week": "W", "month": "M", "year": "Y"}
+# Au-delà, les couples (profil, période) sont numérotés par np.unique plutôt que par un bincount dense
+_DENSE_GROUPS_MAX = 1 << 24
+PERCENTILES = (50, 90, 99)
+
+# Les descriptions peuvent dépasser la limite par défaut du module csv (128 Ko); borné à 2**31-1 car
+# field_size_limit prend un long C, qui fait 32 bits sous Windows
+csv.field_size_limit(min(sys.maxsize, 2 ** 31 - 1))
+
+_VIDEO_URL_RE = re.compile(r"/@([^/?#]+)/video/(\d+)")
+_PREFIX_RE = re.compile(r"/@([^/?#]+)/video/$")
+
+
+'''
+On va retrouver le profil et l’ID de la vidéo à partir de son URL: le CSV du scraper n’a pas de colonne profil,
+mais chaque URL a la forme https://www.tiktok.com/@<profil>/video/<id>.
+Un ID qui ne tient pas sur 64 bits est traité comme une URL inattendue.
+'''
+def _split_video_url(url: str) -> Tuple[str, int]:
+    m = _VIDEO_URL_RE.search(url or "")
+    if not m:
+        return "", 0
+    vid = int(m.group(2))
+    if vid >= 1 << 64:
+        return "", 0
+    return m.group(1), vid
+
+
+'''
+Petit utilitaire: convertir une cellule CSV en entier, 0 si elle est vide, invalide ou hors de l’intervalle int64.
+'''
+def _to_int(txt: str) -> int:
+    try:
+        val = int(txt)
+    except (TypeError, ValueError):
+        try:
+            val = int(float(txt))
+        except (TypeError, ValueError, OverflowError):
+            return 0
+    return val if -(1 << 63) <= val < (1 << 63) else 0
+
+
+def _cache_dir(path: str) -> str:
+    return path + ".cols"
+
+
+'''
+Petits utilitaires du cache: l’en-tête du CSV (et sa taille en octets), le meta.json du cache,
+et une empreinte de tous les octets déjà analysés pour vérifier qu’un fichier a seulement grandi par la fin
+(le scraper réécrit ses CSV en entier: une ligne modifiée à taille égale doit invalider le cache).
+Hacher le préfixe reste bien moins coûteux que de le réanalyser.
+'''
+def _read_header(path: str) -> Tuple[List[str], int]:
+    with open(path, "rb") as f:
+        line = f.readline()
+    header = next(csv.reader([line.decode("utf-8-sig", errors="replace")]), [])
+    return [h.strip() for h in header], len(line)
+
+
+def _column_index(header: List[str], path: str) -> Tuple[int, int, int, int]:
+    try:
+        return header.index("url"), header.index("views"), header.index("likes"), header.index("comments")
+    except ValueError:
+        raise ValueError(f"{path}: colonnes url/views/likes/comments introuvables")
+
+
+def _read_meta(path: str) -> Optional[Dict]:
+    try:
+        with open(os.path.join(_cache_dir(path), "meta.json"), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        return meta if meta.get("version") == CACHE_VERSION else None
+    except Exception:
+        return None
+
+
+def _prefix_hasher(path: str, end: int, start: int = 0, hasher=None):
+    hasher = hasher or hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        f.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            data = f.read(min(CHUNK_BYTES, remaining))
+            if not data:
+                break
+            hasher.update(data)
+            remaining -= len(data)
+    return hasher
+
+
+'''
+Lecture lente, ligne par ligne avec le module csv: utilisée seulement pour les blocs que le parseur vectorisé
+ne sait pas découper proprement (lignes vides, nombre de colonnes inattendu...).
+'''
+def _parse_rows_slow(text: str, idx: Tuple[int, int, int, int], profiles: Dict[str, int]) -> Dict[str, np.ndarray]:
+    i_url, i_views, i_likes, i_comments = idx
+    width = max(idx) + 1
+    video_ids = array("Q")
+    profile_codes = array("i")
+    views = array("q")
+    likes = array("q")
+    comments = array("q")
+    for row in csv.reader(io.StringIO(text, newline="")):
+        if len(row) < width:
+            continue
+        profile, vid = _split_video_url(row[i_url])
+        video_ids.append(vid)
+        profile_codes.append(profiles.setdefault(profile, len(profiles)))
+        views.append(_to_int(row[i_views]))
+        likes.append(_to_int(row[i_likes]))
+        comments.append(_to_int(row[i_comments]))
+    return {
+        "video_id": np.frombuffer(video_ids, dtype=np.uint64),
+        "profile": np.frombuffer(profile_codes, dtype=np.int32),
+        "views": np.frombuffer(views, dtype=np.int64),
+        "likes": np.frombuffer(likes, dtype=np.int64),
+        "comments": np.frombuffer(comments, dtype=np.int64),
+    }
+
+
+'''
+Conversion vectorisée d’entiers décimaux: chaque champ [start, end) est lu sur une fenêtre de la largeur du plus long
+champ du bloc, plafonnée à 18 octets (le maximum sans débordement en int64).
+Les champs qui ne sont pas de simples chiffres sont relus avec _to_int.
+'''
+def _parse_int_fields(buf: np.ndarray, start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    w = end - start
+    width = int(min(18, max(1, w.max(initial=1))))
+    j = np.arange(width)
+    valid = j < w[:, None]
+    digits = buf[np.minimum(start[:, None] + j, len(buf) - 1)].astype(np.int64) - 48
+    ok = (w <= width) & np.all(~valid | ((digits >= 0) & (digits <= 9)), axis=1)
+    powers = 10 ** np.arange(width, dtype=np.int64)
+    exponent = np.clip(w[:, None] - 1 - j, 0, width - 1)
+    values = np.where(valid, digits * powers[exponent], 0).sum(axis=1)
+    for i in np.flatnonzero(~ok).tolist():
+        values[i] = _to_int(buf[start[i]:end[i]].tobytes().decode("utf-8", errors="replace"))
+    return values
+
+
+def _outside_quotes(positions: np.ndarray, quotes: np.ndarray) -> np.ndarray:
+    return positions[(np.searchsorted(quotes, positions) & 1) == 0]
+
+
+'''
+Découpage vectorisé d’un bloc de lignes complètes (il se termine par un saut de ligne hors guillemets).
+Les virgules et sauts de ligne hors guillemets sont les séparateurs: la parité du nombre de guillemets placés avant
+suffit à savoir si l’on est dans un champ entre guillemets (les "" échappés s’annulent).
+Si toutes les lignes ont le nombre de champs de l’en-tête, les séparateurs forment une grille lignes × colonnes
+et l’on n’extrait que url, views, likes et comments, sans jamais décoder les descriptions.
+Pour l’URL, l’ID est la suite de chiffres finale et le reste de l’URL (…/@profil/video/) ne prend que quelques
+valeurs distinctes: une seule regex par préfixe, le reste est une recherche dans un dict.
+C’est la seule boucle Python par ligne qui reste (découpage des préfixes et recherche dans le dict).
+Renvoie None si le bloc est irrégulier: l’appelant repasse alors par _parse_rows_slow.
+'''
+def _parse_block(
+    buf: np.ndarray,
+    candidates: np.ndarray,
+    quotes: np.ndarray,
+    idx: Tuple[int, int, int, int],
+    n_fields: int,
+    profiles: Dict[str, int],
+    prefixes: Dict[bytes, int],
+) -> Optional[Dict[str, np.ndarray]]:
+    seps = _outside_quotes(candidates, quotes)
+    is_nl = buf[seps] == 10
+    n_rows = int(is_nl.sum())
+    if not n_rows or len(seps) != n_rows * n_fields or not is_nl.reshape(n_rows, n_fields)[:, -1].all():
+        return None
+
+    grid = seps.reshape(n_rows, n_fields)
+    starts = np.empty_like(grid)
+    starts[:, 1:] = grid[:, :-1] + 1
+    starts[0, 0] = 0
+    starts[1:, 0] = grid[:-1, -1] + 1
+    ends = grid.copy()
+    # csv.writer termine les lignes par \r\n
+    ends[:, -1] -= (buf[np.maximum(ends[:, -1] - 1, 0)] == 13) & (ends[:, -1] > starts[:, -1])
+
+    def field(i: int) -> Tuple[np.ndarray, np.ndarray]:
+        s, e = starts[:, i].copy(), ends[:, i].copy()
+        quoted = (e - s >= 2) & (buf[s] == 34) & (buf[np.maximum(e - 1, 0)] == 34)
+        return s + quoted, e - quoted
+
+    i_url, i_views, i_likes, i_comments = idx
+    url_s, url_e = field(i_url)
+
+    # Suite de chiffres en fin d’URL: fenêtre de 20 octets, seuls les IDs de 19 chiffres au plus (< 2**64) sont lus ici
+    width = 20
+    j = np.arange(width)
+    pos = url_e[:, None] - width + j
+    tail = buf[np.maximum(pos, 0)]
+    is_digit = (pos >= url_s[:, None]) & (tail >= 48) & (tail <= 57)
+    run = np.cumprod(is_digit[:, ::-1], axis=1).sum(axis=1)
+    powers = 10 ** np.arange(width - 1, dtype=np.uint64)
+    rank = (width - 1 - j)[None, :]
+    video_id = np.where(
+        rank < np.minimum(run, width - 1)[:, None],
+        (tail.astype(np.uint64) - np.uint64(48)) * powers[np.minimum(rank, width - 2)],
+        np.uint64(0),
+    ).sum(axis=1, dtype=np.uint64)
+
+    raw = buf.tobytes()
+    prefix_end = (url_e - run).tolist()
+    keys = [raw[a:b] for a, b in zip(url_s.tolist(), prefix_end)]
+    # dict.fromkeys garde l’ordre d’apparition: les profils sont numérotés comme avec le module csv
+    for key in [k for k in dict.fromkeys(keys) if k not in prefixes]:
+        m = _PREFIX_RE.search(key.decode("utf-8", errors="replace"))
+        prefixes[key] = profiles.setdefault(m.group(1), len(profiles)) if m else -1
+    profile = np.array([prefixes[k] for k in keys], dtype=np.int32)
+
+    # URL inattendue, sans ID final ou ID trop long pour la fenêtre: on repasse par la regex sur l’URL complète
+    for i in np.flatnonzero((profile < 0) | (run == 0) | (run == width)).tolist():
+        name, vid = _split_video_url(raw[url_s[i]:url_e[i]].decode("utf-8", errors="replace"))
+        profile[i] = profiles.setdefault(name, len(profiles))
+        video_id[i] = vid
+
+    cols = {"video_id": video_id, "profile": profile}
+    for name, i in (("views", i_views), ("likes", i_likes), ("comments", i_comments)):
+        cols[name] = _parse_int_fields(buf, *field(i))
+    return cols
+
+
+'''
+Cette fonction lit le CSV à partir de l’octet start, par blocs de CHUNK_BYTES coupés sur une fin de ligne hors guillemets,
+et ne garde que les colonnes numériques. La mémoire reste bornée par la taille d’un bloc, quelle que soit celle du fichier.
+Elle renvoie les colonnes, l’offset jusqu’où le fichier a été lu et si la dernière ligne n’avait pas de saut de ligne.
+'''
+def _parse_csv_from(
+    path: str, start: int, idx: Tuple[int, int, int, int], n_fields: int, profiles: Dict[str, int]
+) -> Tuple[Dict[str, np.ndarray], int, bool]:
+    parts: List[Dict[str, np.ndarray]] = []
+    prefixes: Dict[bytes, int] = {}
+    carry = b""
+    offset = start
+    partial = False
+    with open(path, "rb") as f:
+        f.seek(start)
+        while True:
+            data = f.read(CHUNK_BYTES)
+            block = carry + data
+            if not block:
+                break
+            if not data and not block.endswith(b"\n"):
+                partial = True
+                block += b"\n"
+            buf = np.frombuffer(block, dtype=np.uint8)
+            quotes = np.flatnonzero(buf == 34)
+            # virgules et sauts de ligne, repérés en une seule passe sur le bloc
+            candidates = np.flatnonzero((buf == 44) | (buf == 10))
+            newlines = _outside_quotes(candidates[buf[candidates] == 10], quotes)
+            if not len(newlines):
+                if not data:
+                    # guillemet jamais refermé en fin de fichier: le module csv tranche
+                    parts.append(_parse_rows_slow(block.decode("utf-8", errors="replace"), idx, profiles))
+                    offset += len(block) - (1 if partial else 0)
+                    break
+                carry = block
+                continue
+            cut = int(newlines[-1]) + 1
+            cols = _parse_block(
+                buf[:cut],
+                candidates[:np.searchsorted(candidates, cut)],
+                quotes[:np.searchsorted(quotes, cut)],
+                idx, n_fields, profiles, prefixes,
+            )
+            if cols is None:
+                cols = _parse_rows_slow(block[:cut].decode("utf-8", errors="replace"), idx, profiles)
+            parts.append(cols)
+            carry = block[cut:]
+            offset += cut - (1 if partial else 0)
+            if not data:
+                break
+
+    if not parts:
+        return {name: np.zeros(0, dtype=dtype) for name, dtype in COLUMNS.items()}, offset, partial
+    return {name: np.concatenate([p[name] for p in parts]).astype(dtype, copy=False) for name, dtype in COLUMNS.items()}, offset, partial
+
+
+def _save_cache(path: str, cols: Dict[str, np.ndarray], meta: Dict) -> None:
+    cache = _cache_dir(path)
+    try:
+        os.makedirs(cache, exist_ok=True)
+        # meta.json retiré d’abord puis réécrit en dernier: sa présence valide le cache
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(os.path.join(cache, "meta.json"))
+        for name, values in cols.items():
+            np.save(os.path.join(cache, f"{name}.npy"), values)
+        with open(os.path.join(cache, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump(meta, f)
+    except OSError:
+        pass
+
+
+'''
+Cette fonction charge les colonnes numériques d’un CSV du scraper, en passant par le cache <fichier>.cols:
+1-Fichier inchangé (taille/mtime): les .npy sont ouverts en memory-map, rien n’est relu.
+2-Fichier qui a seulement grandi, avec les octets déjà analysés strictement identiques (même empreinte):
+seuls les octets ajoutés sont analysés.
+3-Sinon (pas de cache, fichier réécrit): analyse complète avec le parseur vectorisé.
+Si le dossier n’est pas accessible en écriture, on continue simplement sans cache.
+'''
+def _load_file_columns(path: str) -> Tuple[Dict[str, np.ndarray], List[str]]:
+    header, data_start = _read_header(path)
+    idx = _column_index(header, path)
+    st = os.stat(path)
+    meta = _read_meta(path)
+    profiles: Dict[str, int] = {}
+    start = data_start
+    cached: Optional[Dict[str, np.ndarray]] = None
+    hasher = None
+
+    if meta and meta.get("header") == header:
+        try:
+            cached = {name: np.load(os.path.join(_cache_dir(path), f"{name}.npy"), mmap_mode="r") for name in COLUMNS}
+        except Exception:
+            cached = None
+    if cached is not None:
+        if meta["size"] == st.st_size and meta["mtime_ns"] == st.st_mtime_ns:
+            return cached, list(meta["profiles"])
+        offset = meta["offset"]
+        if not meta["partial"] and st.st_size > offset:
+            hasher = _prefix_hasher(path, offset)
+        if hasher is not None and hasher.hexdigest() == meta["prefix"]:
+            profiles = {name: i for i, name in enumerate(meta["profiles"])}
+            start = offset
+        else:
+            cached = None
+            hasher = None
+
+    cols, offset, partial = _parse_csv_from(path, start, idx, len(header), profiles)
+    if cached is not None:
+        cols = {name: np.concatenate([cached[name], cols[name]]) for name in COLUMNS}
+    names = list(profiles)
+    _save_cache(path, cols, {
+        "version": CACHE_VERSION,
+        "header": header,
+        "size": st.st_size,
+        "mtime_ns": st.st_mtime_ns,
+        "offset": offset,
+        "partial": partial,
+        # on prolonge l’empreinte déjà calculée sur l’ancien préfixe au lieu de tout relire
+        "prefix": _prefix_hasher(path, offset, start=start if hasher else 0, hasher=hasher).hexdigest(),
+        "profiles": names,
+    })
+    return cols, names
+
+
+'''
+Maintenant, on va charger un ou plusieurs fichiers de sortie (ou dossiers contenant des CSV) en colonnes NumPy.
+Les codes de profil de chaque fichier sont ramenés sur une table commune, puis les doublons d’une même vidéo
+(plusieurs runs sur le même profil) sont supprimés en gardant la dernière occurrence.
+'''
+def load_columns(paths: List[str]) -> Tuple[Dict[str, np.ndarray], List[str]]:
+    # (chemin, nommé explicitement): un CSV trouvé en parcourant un dossier peut ne pas venir du scraper
+    files: List[Tuple[str, bool]] = []
+    for p in paths:
+        if os.path.isdir(p):
+            files.extend((os.path.join(p, n), False) for n in sorted(os.listdir(p)) if n.lower().endswith(".csv"))
+        else:
+            files.append((p, True))
+    if not files:
+        raise ValueError("Aucun fichier CSV à analyser.")
+
+    parts: List[Dict[str, np.ndarray]] = []
+    profiles: Dict[str, int] = {}
+    for path, explicit in files:
+        try:
+            loaded = _load_file_columns(path)
+        except (OSError, ValueError) as e:
+            if explicit:
+                raise
+            print(f"Ignoré: {path}: {e}" if isinstance(e, OSError) else f"Ignoré: {e}")
+            continue
+        cols, names = loaded
+        remap = np.array([profiles.setdefault(n, len(profiles)) for n in names] or [0], dtype=np.int32)
+        cols = dict(cols)
+        cols["profile"] = remap[cols["profile"]] if len(cols["profile"]) else cols["profile"]
+        parts.append(cols)
+
+    if not parts:
+        raise ValueError("Aucun CSV du scraper à analyser.")
+    if len(parts) == 1:
+        merged = parts[0]
+    else:
+        merged = {name: np.concatenate([c[name] for c in parts]) for name in COLUMNS}
+
+    vid = merged["video_id"]
+    n = len(vid)
+    if n:
+        # Tri stable par ID: dans chaque série d’IDs égaux, le dernier élément est la dernière occurrence
+        order = np.argsort(vid, kind="stable")
+        sorted_vid = vid[order]
+        last = np.ones(n, dtype=bool)
+        last[:-1] = sorted_vid[1:] != sorted_vid[:-1]
+        keep = np.zeros(n, dtype=bool)
+        keep[order[last]] = True
+        # Les lignes sans ID (URL inattendue) sont conservées telles quelles
+        keep |= vid == 0
+        if not keep.all():
+            merged = {name: merged[name][keep] for name in COLUMNS}
+    return merged, list(profiles)
+
+
+'''
+Agrégats vectorisés par groupe (codes 0..n_groups-1): nombre de vidéos, totaux, taux d’engagement pondéré
+(likes+commentaires)/vues, taux moyen par vidéo et médiane des vues.
+La médiane passe par un seul tri (groupe, vues) au lieu d’une boucle par groupe: une clé int64 unique
+groupe × plage de vues quand elle tient, sinon un tri lexicographique.
+'''
+def _group_stats(codes: np.ndarray, n_groups: int, cols: Dict[str, np.ndarray], rate: np.ndarray) -> Dict[str, np.ndarray]:
+    count = np.bincount(codes, minlength=n_groups)
+    views = np.bincount(codes, weights=cols["views"], minlength=n_groups)
+    likes = np.bincount(codes, weights=cols["likes"], minlength=n_groups)
+    comments = np.bincount(codes, weights=cols["comments"], minlength=n_groups)
+
+    valid = ~np.isnan(rate)
+    rate_sum = np.bincount(codes[valid], weights=rate[valid], minlength=n_groups)
+    rate_n = np.bincount(codes[valid], minlength=n_groups)
+
+    values = np.asarray(cols["views"])
+    vmin = int(values.min()) if values.size else 0
+    span = int(values.max()) - vmin + 1 if values.size else 1
+    if n_groups * span < (1 << 62):
+        order = np.argsort(codes.astype(np.int64) * span + (values - vmin))
+    else:
+        order = np.lexsort((values, codes))
+    sorted_views = values[order].astype(np.float64)
+    starts = np.concatenate(([0], np.cumsum(count)[:-1]))
+    median = np.full(n_groups, np.nan)
+    has = count > 0
+    if sorted_views.size:
+        lo = starts[has] + (count[has] - 1) // 2
+        hi = starts[has] + count[has] // 2
+        median[has] = (sorted_views[lo] + sorted_views[hi]) / 2
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        engagement = np.where(views > 0, (likes + comments) / views, np.nan)
+        mean_rate = np.where(rate_n > 0, rate_sum / rate_n, np.nan)
+
+    return {
+        "videos": count,
+        "views": views,
+        "likes": likes,
+        "comments": comments,
+        "engagement_rate": engagement,
+        "mean_engagement_rate": mean_rate,
+        "median_views": median,
+    }
+
+
+def _num(x) -> Optional[float]:
+    x = float(x)
+    if np.isnan(x):
+        return None
+    return int(x) if x.is_integer() and abs(x) < 2 ** 53 else x
+
+
+'''
+Conversion d’une colonne de stats en liste Python en une seule fois, avec les mêmes règles que _num
+(entier si la valeur est entière, None pour NaN), pour ne pas appeler _num sur chaque case du rapport.
+'''
+def _column_to_list(values: np.ndarray) -> List:
+    values = np.asarray(values)
+    if values.dtype.kind in "iu":
+        return values.tolist()
+    nan = np.isnan(values)
+    whole = ~nan & (values == np.floor(values)) & (np.abs(values) < 2 ** 53)
+    if whole.all():
+        return values.astype(np.int64).tolist()
+    out = values.astype(object)
+    out[whole] = values[whole].astype(np.int64).tolist()
+    out[nan] = None
+    return out.tolist()
+
+
+def _group_rows(stats: Dict[str, np.ndarray], labels: List[Dict]) -> List[Dict]:
+    names = list(stats)
+    columns = [_column_to_list(stats[k]) for k in names]
+    return [{**label, **dict(zip(names, values))} for label, values in zip(labels, zip(*columns))]
+
+
+'''
+Cette fonction calcule tout le rapport à partir des fichiers de sortie du scraper:
+
+1-Taux d’engagement (likes+commentaires)/vues par vidéo.
+
+2-Percentiles des vues, likes, commentaires et du taux d’engagement.
+
+3-Vidéos atypiques: taux d’engagement au-dessus de Q3 + outlier_k × IQR.
+
+4-Agrégats par profil, puis par profil et par période (jour/semaine/mois/année).
+La date de publication vient de l’ID TikTok lui-même (les 32 bits de poids fort sont un timestamp Unix).
+
+Elle renvoie un dictionnaire sérialisable en JSON.
+'''
+def summarize(paths: List[str], bucket: str = "month", top: int = 10, outlier_k: float = 1.5) -> Dict:
+    if bucket not in BUCKETS:
+        raise ValueError(f"Période inconnue: {bucket} (choix: {', '.join(BUCKETS)})")
+    cols, profiles = load_columns(paths)
+    n = len(cols["video_id"])
+
+    views = np.asarray(cols["views"], dtype=np.float64)
+    interactions = np.asarray(cols["likes"], dtype=np.float64) + np.asarray(cols["comments"], dtype=np.float64)
+    rate = np.full(n, np.nan)
+    np.divide(interactions, views, out=rate, where=views > 0)
+
+    total_views = float(views.sum())
+    report: Dict = {
+        "files": list(paths),
+        "rows": n,
+        "profiles": len(profiles),
+        "bucket": bucket,
+        "overall": {
+            "views": _num(total_views),
+            "likes": _num(cols["likes"].sum()) if n else 0,
+            "comments": _num(cols["comments"].sum()) if n else 0,
+            "engagement_rate": _num(interactions[views > 0].sum() / total_views) if total_views else None,
+            "mean_engagement_rate": _num(np.nanmean(rate)) if np.any(~np.isnan(rate)) else None,
+        },
+        "percentiles": {},
+        "outliers": {"fence": None, "count": 0, "top": []},
+        "by_profile": [],
+        "by_period": [],
+    }
+    if not n:
+        return report
+
+    valid = ~np.isnan(rate)
+    for name, values in (("views", cols["views"]), ("likes", cols["likes"]), ("comments", cols["comments"]), ("engagement_rate", rate[valid])):
+        if len(values):
+            pct = np.percentile(values, PERCENTILES)
+            report["percentiles"][name] = {f"p{p}": _num(v) for p, v in zip(PERCENTILES, pct)}
+
+    if valid.any():
+        q1, q3 = np.percentile(rate[valid], (25, 75))
+        fence = q3 + outlier_k * (q3 - q1)
+        idx = np.flatnonzero(valid & (rate > fence))
+        best = idx[np.argsort(rate[idx])[::-1][:max(0, top)]]
+        report["outliers"] = {
+            "fence": _num(fence),
+            "count": int(idx.size),
+            "top": [
+                {
+                    "url": f"{PROFILE_BASE}/@{profiles[cols['profile'][i]]}/video/{int(cols['video_id'][i])}",
+                    "views": int(cols["views"][i]),
+                    "likes": int(cols["likes"][i]),
+                    "comments": int(cols["comments"][i]),
+                    "engagement_rate": _num(rate[i]),
+                }
+                for i in best
+            ],
+        }
+
+    codes = np.asarray(cols["profile"], dtype=np.intp)
+    stats = _group_stats(codes, len(profiles), cols, rate)
+    rows = _group_rows(stats, [{"profile": p} for p in profiles])
+    # Un profil dont toutes les lignes ont été dédoublonnées ailleurs n’a plus de vidéo
+    rows = [r for r in rows if r["videos"]]
+    report["by_profile"] = sorted(rows, key=lambda r: r["views"] or 0, reverse=True)
+    report["profiles"] = len(rows)
+
+    # Période = timestamp Unix encodé dans l’ID; les IDs sans date (0) tombent en 1970 et restent visibles
+    unit = BUCKETS[bucket]
+    created = (np.asarray(cols["video_id"]) >> np.uint64(32)).astype(np.int64).astype("datetime64[s]")
+    if bucket == "week":
+        # datetime64[W] compte les semaines depuis le jeudi 1970-01-01: on numérote plutôt des semaines ISO
+        # (lundi → dimanche), étiquetées par leur lundi (le jour 0 est un jeudi, d’où le décalage de 3 jours)
+        periods = (created.astype("datetime64[D]").astype(np.int64) + 3) // 7
+    else:
+        periods = created.astype(f"datetime64[{unit}]").astype(np.int64)
+    first = int(periods.min())
+    span = int(periods.max()) - first + 1
+    keys = codes.astype(np.int64) * span + (periods - first)
+    if len(profiles) * span <= _DENSE_GROUPS_MAX:
+        present = np.bincount(keys, minlength=len(profiles) * span) > 0
+        uniq = np.flatnonzero(present)
+        group_idx = (np.cumsum(present) - 1)[keys]
+    else:
+        uniq, group_idx = np.unique(keys, return_inverse=True)
+    stats = _group_stats(group_idx.ravel(), len(uniq), cols, rate)
+    def period_label(p: int) -> str:
+        if bucket == "week":
+            return str(np.datetime64(p * 7 - 3, "D"))
+        return str(np.datetime64(p, unit))
+
+    labels = [{"profile": profiles[k // span], "period": period_label(first + k % span)} for k in uniq.tolist()]
+    report["by_period"] = _group_rows(stats, labels)
+    return report
+
+
+'''
+Maintenant, on va afficher le rapport dans la console, dans le même esprit que l’extrait du scraper.
+'''
+def print_summary(report: Dict, max_rows: int = 20) -> None:
+    def pct(x) -> str:
+        return f"{x * 100:.2f}%" if x is not None else "-"
+
+    ov = report["overall"]
+    print(f"\nVidéos: {report['rows']} | Profils: {report['profiles']} | Fichiers: {len(report['files'])}")
+    print(f"Vues={ov['views']} likes={ov['likes']} commentaires={ov['comments']}")
+    print(f"Engagement global={pct(ov['engagement_rate'])} | moyen par vidéo={pct(ov['mean_engagement_rate'])}")
+
+    if report["percentiles"]:
+        print("\nPercentiles:")
+        for name, values in report["percentiles"].items():
+            fmt = pct if name == "engagement_rate" else str
+            print(f"    {name}: " + " ".join(f"{k}={fmt(v)}" for k, v in values.items()))
+
+    out = report["outliers"]
+    print(f"\nVidéos atypiques (engagement > {pct(out['fence'])}): {out['count']}")
+    for i, r in enumerate(out["top"], 1):
+        print(f"{i:02d}. {r['url']}\n    vues={r['views']} likes={r['likes']} commentaires={r['comments']} engagement={pct(r['engagement_rate'])}")
+
+    print("\nPar profil:")
+    for r in report["by_profile"][:max_rows]:
+        print(
+            f"    @{r['profile']}: vidéos={r['videos']} vues={r['views']} médiane={r['median_views']} "
+            f"engagement={pct(r['engagement_rate'])}"
+        )
+
+    print(f"\nPar profil et par période ({report['bucket']}):")
+    for r in report["by_period"][:max_rows]:
+        print(f"    @{r['profile']} {r['period']}: vidéos={r['videos']} vues={r['views']} engagement={pct(r['engagement_rate'])}")
+    if len(report["by_period"]) > max_rows:
+        print(f"    ... {len(report['by_period']) - max_rows} lignes de plus (voir --export)")
+
+
+'''
+Export du rapport: JSON complet si le chemin finit par .json, sinon CSV des agrégats
+(une ligne par profil avec period="all", puis une ligne par profil et par période).
+'''
+def export_summary(report: Dict, path: str) -> None:
+    ensure_output_dir(path)
+    if path.lower().endswith(".json"):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        return
+    fields = ["profile", "period", "videos", "views", "likes", "comments", "engagement_rate", "mean_engagement_rate", "median_views"]
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        for r in report["by_profile"]:
+            writer.writerow({**r, "period": "all"})
+        for r in report["by_period"]:
+            writer.writerow(r)
+
+
+'''
+Cette fonction sert à lancer l’analyse depuis la console: scraper.py summarize <fichiers...>.
+'''
+def run_summarize_cli(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="scraper.py summarize", description="Analyser un ou plusieurs CSV produits par le scraper.")
+    parser.add_argument("paths", nargs="+", help="Fichiers CSV (ou dossiers contenant des CSV)")
+    parser.add_argument("--bucket", choices=list(BUCKETS), default="month", help="Période d’agrégation (défaut: month)")
+    parser.add_argument("--top", type=int, default=10, help="Nombre de vidéos atypiques à lister (défaut: 10)")
+    parser.add_argument("--outlier-k", type=float, default=1.5, help="Multiplicateur de l’IQR pour les vidéos atypiques (défaut: 1.5)")
+    parser.add_argument("--print-rows", type=int, default=20, help="Afficher les N premières lignes de chaque tableau (défaut: 20)")
+    parser.add_argument("--export", type=str, default="", help="Chemin d’export du rapport (.json ou .csv)")
+    args = parser.parse_args(argv)
+
+    try:
+        report = summarize(args.paths, bucket=args.bucket, top=args.top, outlier_k=args.outlier_k)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+    print_summary(report, max_rows=args.print_rows)
+    if args.export:
+        try:
+            export_summary(report, args.export)
+        except OSError as e:
+            parser.error(f"export impossible: {e}")
+        print(f"\nRapport écrit: {args.export}")
+
+
+if __name__ == "__main__":
+    run_summarize_cli()
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+
+PROFILE_BASE = "https://www.tiktok.com"
+
+
+'''
+Cette fonction vérifie que le dossier où tu veux enregistrer un fichier existe.
+Si le dossier n’existe pas, elle le crée automatiquement.
+'''
+def ensure_output_dir(path: str) -> None:
+    directory = os.path.dirname(os.path.abspath(path))
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory, exist_ok=True)